@@ -10,12 +10,16 @@
 
 import math
 from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from .utils import (
     discretize_concrete_core_into_rings,
     steel_ring_area,
     steel_working_condition_coeff,
-    concrete_working_condition_coeff,
-    concrete_strain_by_temp
+    concrete_coeffs_vec,
+    concrete_strains_vec,
+    pick_thermal_record
 )
 from .config import MATERIAL_CONSTANTS
 
@@ -30,6 +34,11 @@ def get_thermal_record_for_time(
     Выбирается запись с максимальным временем, не превышающим заданное.
     Если такой записи нет, выбирается запись с минимальным временем.
 
+    Индекс для поиска строится один раз и кэшируется по id() списка, поэтому
+    переданный список и его записи нельзя изменять после первого вызова:
+    изменения не будут замечены. Для новых данных передайте новый список или
+    вызовите clear_thermal_index_cache().
+
     Args:
         thermal_data: Список температурных данных
         fire_exposure_time_sec: Время пожара в секундах
@@ -37,29 +46,39 @@ def get_thermal_record_for_time(
     Returns:
         Словарь с температурными данными или None
     """
-    if not thermal_data:
-        return None
-
-    # Фильтруем записи с корректным временем
-    suitable_records = [
-        r for r in thermal_data
-        if isinstance(r.get('time_minutes'), (int, float))
-        and r.get('time_minutes', -1) <= fire_exposure_time_sec
-    ]
+    return pick_thermal_record(thermal_data, fire_exposure_time_sec)
 
-    if suitable_records:
-        # Берём запись с максимальным временем
-        return max(suitable_records, key=lambda x: x.get('time_minutes', -1))
-    else:
-        # Берём запись с минимальным временем
-        all_time_records = [
-            r for r in thermal_data
-            if isinstance(r.get('time_minutes'), (int, float))
-        ]
-        if all_time_records:
-            return min(all_time_records, key=lambda x: x.get('time_minutes', float('inf')))
 
-    return None
+def sum_concrete_rings(
+    rings: Dict[str, np.ndarray],
+    concrete_strength_mpa: float
+) -> Tuple[float, float]:
+    """
+    Несущая способность и жёсткость бетонных колец одним векторным расчётом.
+
+    Args:
+        rings: Словарь массивов из discretize_concrete_core_into_rings
+        concrete_strength_mpa: Нормативное сопротивление бетона в МПа
+
+    Returns:
+        Кортеж (N_кН, EI_кН·м²); кольца без температуры пропускаются,
+        кольца без деформации (бетон разрушен) не дают жёсткости
+    """
+    known = ~np.isnan(rings['temperature_celsius'])
+    temps = rings['temperature_celsius'][known]
+    R_out = rings['outer_radius_mm'][known]
+    R_in = rings['inner_radius_mm'][known]
+
+    f_cd_fire = concrete_coeffs_vec(temps) * concrete_strength_mpa
+    N_rings = rings['area_mm2'][known] / 1e6 * f_cd_fire * 1e3  # кН
+
+    strain = concrete_strains_vec(temps)
+    has_strain = strain > 0
+    I_rings = (math.pi / 4) * (R_out[has_strain]**4 - R_in[has_strain]**4) / 1e12  # м^4
+    E_c_fire = f_cd_fire[has_strain] / (strain[has_strain] * 1e-3)
+    stiffness = I_rings * E_c_fire * 1e3  # кН·м²
+
+    return float(np.sum(N_rings)), float(np.sum(stiffness))
 
 
 def calculate_stiffness_for_time(
@@ -105,20 +124,9 @@ def calculate_stiffness_for_time(
         num_rings, ring_thicknesses
     )
 
-    # Суммируем жёсткости бетонных колец
-    for ring in concrete_rings:
-        R_out = ring['outer_radius_mm']
-        R_in = ring['inner_radius_mm']
-        I_ring = (math.pi / 4) * (R_out**4 - R_in**4) / 1e12  # м⁴
-
-        if ring['temperature_celsius'] is not None:
-            gamma_bt = concrete_working_condition_coeff(ring['temperature_celsius'])
-            f_cd_fire = gamma_bt * concrete_strength_mpa
-            strain = concrete_strain_by_temp(ring['temperature_celsius'])
-
-            if strain and strain > 0:
-                E_c_fire = f_cd_fire / (strain * 1e-3)  # МПа
-                total_stiffness += I_ring * E_c_fire * 1e3  # кН·м²
+    # Суммируем жёсткости бетонных колец (кольца без температуры пропускаются)
+    _, concrete_stiffness = sum_concrete_rings(concrete_rings, concrete_strength_mpa)
+    total_stiffness += concrete_stiffness  # кН·м²
 
     # Добавляем жёсткость стального кольца
     if thermal_record:
@@ -211,14 +219,9 @@ def calculate_capacity_for_time(
         num_rings, ring_thicknesses
     )
 
-    # Суммируем несущие способности бетонных колец
-    for ring in concrete_rings:
-        if ring['area_mm2'] is not None and ring['temperature_celsius'] is not None:
-            gamma_bt = concrete_working_condition_coeff(ring['temperature_celsius'])
-            f_cd_fire = gamma_bt * concrete_strength_mpa
-            area_m2 = ring['area_mm2'] / 1e6
-            N_ring = area_m2 * f_cd_fire * 1e3  # кН
-            N_total += N_ring
+    # Суммируем несущие способности бетонных колец (кольца без температуры пропускаются)
+    N_concrete, _ = sum_concrete_rings(concrete_rings, concrete_strength_mpa)
+    N_total += N_concrete  # кН
 
     # Добавляем несущую способность стального кольца
     if thermal_record:
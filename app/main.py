@@ -1,6 +1,5 @@
 import sys
 import os
-import json
 import math
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -8,6 +7,7 @@ import altair as alt
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
+import orjson
 from pathlib import Path
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,7 +19,8 @@ from app.utils import (
     calc_section, calc_capacity, discretize_concrete_core_into_rings,
     steel_ring_area, steel_working_condition_coeff,
     concrete_working_condition_coeff, concrete_strain_by_temp,
-    calculate_steel_ring
+    calculate_steel_ring, rings_as_list_of_dicts, build_thermal_index,
+    pick_thermal_record, clear_thermal_index_cache, RING_TEMP_KEYS
 )
 from app.config import (
     GEOMETRY_LIMITS, MATERIAL_CONSTANTS, CALCULATION_CONFIG, DEFAULT_VALUES
@@ -27,7 +28,7 @@ from app.config import (
 from app.validation import validate_all_inputs
 from app.calculations import (
     calculate_final_capacity, calculate_capacity_for_time,
-    calculate_stiffness_for_time, get_reduction_coeff
+    calculate_stiffness_for_time, get_reduction_coeff, sum_concrete_rings
 )
 
 # Функция get_reduction_coeff перенесена в calculations.py
@@ -35,6 +36,90 @@ from app.calculations import (
 st.set_page_config(page_title="Расчёт огнестойкости сталетрубобетонной колонны", page_icon="🔥", layout="wide")
 st.markdown('<div style="text-align:center; font-size:2em; font-weight:700; font-family:Segoe UI, Arial, sans-serif; margin-bottom:0.7em; margin-top:0.2em;">🔥 Расчёт огнестойкости сталетрубобетонной колонны</div>', unsafe_allow_html=True)
 
+# Стили HTML-таблиц расчёта колец (подключаются один раз на страницу)
+RINGS_TABLE_CSS = '''
+<style>
+.rings-table-wrapper { overflow-x: auto; }
+.rings-table {
+    min-width: 900px;
+    width: 100%;
+    border-collapse: separate;
+    border-spacing: 0;
+    background: #fff;
+    border-radius: 8px;
+    box-shadow: 0 1px 6px 0 rgba(0,0,0,0.04);
+    border: 1px solid #e0e0e0;
+    font-size: 0.88em;
+    table-layout: fixed;
+}
+.rings-table th {
+    background: #f6f8fa;
+    color: #222;
+    font-weight: 600;
+    padding: 10px 12px;
+    border-bottom: 1.5px solid #eaecef;
+    border-right: 1px solid #e0e0e0;
+    white-space: normal;
+    word-wrap: break-word;
+}
+.rings-table td {
+    padding: 8px 12px;
+    border-bottom: 1px solid #f0f0f0;
+    color: #222;
+    border-right: 1px solid #e0e0e0;
+    text-align: center;
+    white-space: normal;
+    word-wrap: break-word;
+}
+.rings-table th:first-child,
+.rings-table td:first-child {
+    width: 75px;
+}
+</style>
+'''
+st.markdown(RINGS_TABLE_CSS, unsafe_allow_html=True)
+
+# Стили сводной таблицы результатов для pandas Styler: st.table передаёт их
+# во frontend в рамках id таблицы, поэтому они не затрагивают другие элементы.
+# Рамку со скруглёнными углами даёт контейнер st.table
+SUMMARY_TABLE_STYLES = [
+    {'selector': '', 'props': [
+        ('width', '100%'),
+        ('background', '#fff'),
+        ('font-size', '1.08em'),
+        ('box-shadow', '0 1px 6px 0 rgba(0,0,0,0.04)'),
+    ]},
+    {'selector': 'thead th', 'props': [
+        ('background', '#f6f8fa'),
+        ('color', '#222'),
+        ('font-weight', '600'),
+        ('padding', '12px 18px'),
+        ('border-bottom', '1.5px solid #eaecef'),
+        ('border-right', '1px solid #e0e0e0'),
+    ]},
+    # Столбец «Показатель» — индекс DataFrame, выводится ячейками th
+    {'selector': 'tbody th', 'props': [
+        ('color', '#222'),
+        ('font-weight', '400'),
+        ('padding', '10px 18px'),
+        ('border-bottom', '1px solid #f0f0f0'),
+        ('border-right', '1px solid #e0e0e0'),
+    ]},
+    {'selector': 'td', 'props': [
+        ('color', '#222'),
+        ('padding', '10px 18px'),
+        ('border-bottom', '1px solid #f0f0f0'),
+        ('border-right', '1px solid #e0e0e0'),
+    ]},
+    {'selector': 'th:last-child', 'props': [('border-right', 'none')]},
+    {'selector': 'td:last-child', 'props': [('border-right', 'none')]},
+    {'selector': 'tbody tr:last-child > *', 'props': [('border-bottom', 'none')]},
+    {'selector': 'tbody tr:hover > *', 'props': [
+        ('background', '#f0f6ff'),
+        ('transition', 'background 0.2s'),
+    ]},
+]
+
 with st.sidebar:
     st.header("⚙️ Ввод данных")
 
@@ -154,14 +239,22 @@ def parse_thermal_filename(name: str):
     except ValueError:
         return None
 
-@st.cache_data(show_spinner="Загрузка температурных данных...")
+@st.cache_resource(show_spinner="Загрузка температурных данных...")
 def load_thermal_data():
     """
     Загрузка температурных данных из JSON файлов с кэшированием.
 
+    Данные хранятся как общий ресурс: при перезапуске скрипта возвращаются
+    те же объекты без копирования, поэтому индекс для поиска записи по
+    времени строится один раз. Записи без корректного time_minutes
+    отбрасываются, остальные отсортированы по времени.
+
     Returns:
         Словарь {(диаметр, толщина, диаметр арматуры): данные}
     """
+    # Индексы прежних данных больше не нужны
+    clear_thermal_index_cache()
+
     thermal_dir = Path(PROJECT_ROOT) / "thermal_data"
     if not thermal_dir.exists():
         st.error(f"❌ Директория {thermal_dir} не найдена!")
@@ -175,15 +268,16 @@ def load_thermal_data():
     thermal_data = {}
     for file in thermal_files:
         try:
-            with open(file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file, 'rb') as f:
+                data = orjson.loads(f.read())
             name = file.stem
             geometry = parse_thermal_filename(name)
             if geometry is None:
                 st.warning(f"Не удалось разобрать имя файла: {file.name}")
                 continue
             diameter_val, thickness_val, rebar_val = geometry
-            thermal_data[(diameter_val, thickness_val, rebar_val)] = data
+            _, records = build_thermal_index(data)
+            thermal_data[(diameter_val, thickness_val, rebar_val)] = records
         except Exception as e:
             st.error(f"❌ Ошибка при загрузке файла {file.name}: {str(e)}")
 
@@ -249,7 +343,7 @@ else:
 
 # Расчет и отображение разбиения бетонного ядра на кольца
 fire_exposure_time_sec = fire_exposure_time * 60
-concrete_rings_details = discretize_concrete_core_into_rings(
+concrete_rings = discretize_concrete_core_into_rings(
     diameter, 
     thickness, 
     closest_data, 
@@ -257,18 +351,11 @@ concrete_rings_details = discretize_concrete_core_into_rings(
     num_rings=7,  # Устанавливаем 7 колец
     ring_thicknesses=[10, 20, 20, 20, 20, 20, None]  # Задаем толщины колец, последнее кольцо займет оставшееся пространство
 )
+concrete_rings_details = rings_as_list_of_dicts(concrete_rings)
 temp_steel = None
 temp_rebar = None
 if closest_data:
-    suitable_records = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float)) and r.get('time_minutes', -1) <= fire_exposure_time_sec]
-    if suitable_records:
-        thermal_record = max(suitable_records, key=lambda x: x.get('time_minutes', -1))
-    else:
-        all_time_records = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float))]
-        if all_time_records:
-            thermal_record = min(all_time_records, key=lambda x: x.get('time_minutes', float('inf')))
-        else:
-            thermal_record = None
+    thermal_record = pick_thermal_record(closest_data, fire_exposure_time_sec)
     if thermal_record:
         temp_steel = thermal_record.get('temp_t1')  # Температура стального кольца
         temp_rebar = thermal_record.get('temp_t4')  # Температура арматуры
@@ -279,20 +366,8 @@ slenderness_for_summary_table = None
 reduction_coeff_for_summary_table = None
 N_final_for_summary_table = None
 
-# Суммируем жёсткости всех колец (бетонных и стального) для выбранного fire_exposure_time
-total_stiffness = 0.0
-if concrete_rings_details:
-    for ring in concrete_rings_details:
-        R_out = ring['outer_radius_mm']
-        R_in = ring['inner_radius_mm']
-        I_ring = (math.pi / 4) * (R_out**4 - R_in**4) / 1e12  # м^4
-        if ring['temperature_celsius'] is not None:
-            gamma_bt = concrete_working_condition_coeff(ring['temperature_celsius'])
-            f_cd_fire = gamma_bt * concrete_strength_normative
-            strain = concrete_strain_by_temp(ring['temperature_celsius'])
-            if strain and strain > 0:
-                E_c_fire = f_cd_fire / (strain * 1e-3)
-                total_stiffness += I_ring * E_c_fire * 1e3  # кН·м²
+# Суммируем несущие способности и жёсткости бетонных колец для выбранного fire_exposure_time
+N_concrete, total_stiffness = sum_concrete_rings(concrete_rings, concrete_strength_normative)
 
 # Добавляем жёсткость стального кольца
 if temp_steel is not None and isinstance(temp_steel, (int, float)):
@@ -320,16 +395,8 @@ if use_reinforcement:
 if total_stiffness > 0 and height > 0 and effective_length_coefficient > 0:
     N_cr_for_summary_table = (math.pi ** 2) * total_stiffness / ((height * effective_length_coefficient) ** 2)
 
-# Суммируем несущие способности всех колец для выбранного fire_exposure_time
-N_total = 0.0
-if concrete_rings_details:
-    for ring in concrete_rings_details:
-        if ring['area_mm2'] is not None and ring['temperature_celsius'] is not None:
-            gamma_bt = concrete_working_condition_coeff(ring['temperature_celsius'])
-            f_cd_fire = gamma_bt * concrete_strength_normative
-            area_m2 = ring['area_mm2'] / 1e6
-            N_ring = area_m2 * f_cd_fire * 1e3  # кН
-            N_total += N_ring
+# Несущая способность бетонных колец для выбранного fire_exposure_time
+N_total = N_concrete
 
 # Добавляем несущую способность стального кольца
 if temp_steel is not None and isinstance(temp_steel, (int, float)):
@@ -356,62 +423,24 @@ if N_cr_for_summary_table is not None and N_cr_for_summary_table > 0:
 
 # График несущей способности колонны от времени
 if closest_data:
-    times = sorted(set(int(r['time_minutes'])//60 for r in closest_data if isinstance(r.get('time_minutes'), (int, float))))
-    times = [t for t in range(0, max(times)+1)] if times else [0]
+    # Записи уже очищены и отсортированы по времени при загрузке
+    times = list(range(0, int(closest_data[-1]['time_minutes'])//60 + 1))
     N_final_list = []
     for t_min in times:
         t_sec = t_min * 60
         # Получаем thermal_record для этого времени
-        suitable_records = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float)) and r.get('time_minutes', -1) <= t_sec]
-        if suitable_records:
-            thermal_record = max(suitable_records, key=lambda x: x.get('time_minutes', -1))
-        else:
-            all_time_records = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float))]
-            if all_time_records:
-                thermal_record = min(all_time_records, key=lambda x: x.get('time_minutes', float('inf')))
-            else:
-                thermal_record = None
+        thermal_record = pick_thermal_record(closest_data, t_sec)
         # Пересчёт для каждого времени
         # Бетонные кольца
-        N_total = 0.0
-        total_stiffness = 0.0
-        for i in range(7):  # 7 бетонных колец
-            # Радиусы
-            column_radius_mm = diameter / 2.0
-            concrete_core_outer_radius_mm = column_radius_mm - thickness
-            nominal_thicknesses_mm = [10.0, 20.0, 20.0, 20.0, 20.0, 20.0, None]  # 7 колец
-            if i < 6:  # Для первых 6 колец
-                outer_r = concrete_core_outer_radius_mm - sum(t for t in nominal_thicknesses_mm[:i] if t is not None)
-                inner_r = max(0.0, outer_r - (nominal_thicknesses_mm[i] if nominal_thicknesses_mm[i] is not None else outer_r))
-            else:  # Для последнего кольца
-                outer_r = concrete_core_outer_radius_mm - sum(t for t in nominal_thicknesses_mm[:i] if t is not None)
-                inner_r = 0.0
-            area = math.pi * (outer_r**2 - inner_r**2) if outer_r > inner_r else 0.0
-            temp = None
-            if thermal_record:
-                if i == 0:  # Б1
-                    temp = thermal_record.get('temp_t2')
-                elif i == 1:  # Б2
-                    temp = thermal_record.get('temp_t3')
-                elif i == 2:  # Б3
-                    temp = thermal_record.get('temp_t5')
-                elif i == 3:  # Б4
-                    temp = thermal_record.get('temp_t6')
-                elif i == 4:  # Б5
-                    temp = thermal_record.get('temp_t7')
-                elif i == 5:  # Б6
-                    temp = thermal_record.get('temp_t8')
-                elif i == 6:  # Б7
-                    temp = thermal_record.get('temp_t9')
-            gamma_bt = concrete_working_condition_coeff(temp) if temp is not None else None
-            f_cd_fire = gamma_bt * concrete_strength_normative if gamma_bt is not None else None
-            strain = concrete_strain_by_temp(temp) if temp is not None else None
-            E_c_fire = f_cd_fire / (strain * 1e-3) if (f_cd_fire is not None and strain and strain > 0) else None
-            I_ring = (math.pi / 4) * (outer_r**4 - inner_r**4) / 1e12 if outer_r > inner_r else 0.0
-            N_ring = area / 1e6 * f_cd_fire * 1e3 if (area > 0 and f_cd_fire is not None) else 0.0
-            stiffness = I_ring * E_c_fire * 1e3 if (I_ring and E_c_fire) else 0.0
-            N_total += N_ring
-            total_stiffness += stiffness
+        rings_for_time = discretize_concrete_core_into_rings(
+            diameter,
+            thickness,
+            closest_data,
+            t_sec,
+            num_rings=CALCULATION_CONFIG.NUM_CONCRETE_RINGS,
+            ring_thicknesses=CALCULATION_CONFIG.RING_THICKNESSES_MM
+        )
+        N_total, total_stiffness = sum_concrete_rings(rings_for_time, concrete_strength_normative)
         # Стальное кольцо
         temp_steel = thermal_record.get('temp_t1') if thermal_record else None
         gamma_st = steel_working_condition_coeff(temp_steel) if temp_steel is not None else None
@@ -518,15 +547,7 @@ if concrete_rings_details:
 s_temp_steel = None
 s_temp_rebar = None
 if closest_data:
-    suitable_records = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float)) and r.get('time_minutes', -1) <= fire_exposure_time_sec]
-    if suitable_records:
-        s_thermal_record = max(suitable_records, key=lambda x: x.get('time_minutes', -1))
-    else:
-        all_time_records = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float))]
-        if all_time_records:
-            s_thermal_record = min(all_time_records, key=lambda x: x.get('time_minutes', float('inf')))
-        else:
-            s_thermal_record = None
+    s_thermal_record = pick_thermal_record(closest_data, fire_exposure_time_sec)
     if s_thermal_record:
         s_temp_steel = s_thermal_record.get('temp_t1')
         s_temp_rebar = s_thermal_record.get('temp_t4')
@@ -756,44 +777,6 @@ with tab1:
         st.markdown(f'<div {table_title_style}>Расчёт бетонного сечения</div>', unsafe_allow_html=True)
         # Основная таблица (бетонные кольца)
         html = '''
-        <style>
-        .rings-table-wrapper { overflow-x: auto; }
-        .rings-table {
-            min-width: 900px;
-            width: 100%;
-            border-collapse: separate;
-            border-spacing: 0;
-            background: #fff;
-            border-radius: 8px;
-            box-shadow: 0 1px 6px 0 rgba(0,0,0,0.04);
-            border: 1px solid #e0e0e0;
-            font-size: 0.88em;
-            table-layout: fixed;
-        }
-        .rings-table th {
-            background: #f6f8fa;
-            color: #222;
-            font-weight: 600;
-            padding: 10px 12px;
-            border-bottom: 1.5px solid #eaecef;
-            border-right: 1px solid #e0e0e0;
-            white-space: normal;
-            word-wrap: break-word;
-        }
-        .rings-table td {
-            padding: 8px 12px;
-            border-bottom: 1px solid #f0f0f0;
-            color: #222;
-            border-right: 1px solid #e0e0e0;
-            text-align: center;
-            white-space: normal;
-            word-wrap: break-word;
-        }
-        .rings-table th:first-child,
-        .rings-table td:first-child {
-            width: 75px;
-        }
-        </style>
         <div class="rings-table-wrapper">
         <table class="rings-table">
         <tr>
@@ -839,44 +822,6 @@ with tab1:
             df_steel = df_steel[steel_columns_order]
             
             html2 = '''
-            <style>
-            .rings-table-wrapper { overflow-x: auto; }
-            .rings-table {
-                min-width: 900px;
-                width: 100%;
-                border-collapse: separate;
-                border-spacing: 0;
-                background: #fff;
-                border-radius: 8px;
-                box-shadow: 0 1px 6px 0 rgba(0,0,0,0.04);
-                border: 1px solid #e0e0e0;
-                font-size: 0.88em;
-                table-layout: fixed;
-            }
-            .rings-table th {
-                background: #f6f8fa;
-                color: #222;
-                font-weight: 600;
-                padding: 10px 12px;
-                border-bottom: 1.5px solid #eaecef;
-                border-right: 1px solid #e0e0e0;
-                white-space: normal;
-                word-wrap: break-word;
-            }
-            .rings-table td {
-                padding: 8px 12px;
-                border-bottom: 1px solid #f0f0f0;
-                color: #222;
-                border-right: 1px solid #e0e0e0;
-                text-align: center;
-                white-space: normal;
-                word-wrap: break-word;
-            }
-            .rings-table th:first-child,
-            .rings-table td:first-child {
-                width: 75px;
-            }
-            </style>
             <div class="rings-table-wrapper">
             <table class="rings-table">
             <tr>
@@ -916,44 +861,6 @@ with tab1:
             
             st.markdown(f'<div {table_title_style}>Расчёт арматуры</div>', unsafe_allow_html=True)
             html3 = '''
-            <style>
-            .rings-table-wrapper { overflow-x: auto; }
-            .rings-table {
-                min-width: 900px;
-                width: 100%;
-                border-collapse: separate;
-                border-spacing: 0;
-                background: #fff;
-                border-radius: 8px;
-                box-shadow: 0 1px 6px 0 rgba(0,0,0,0.04);
-                border: 1px solid #e0e0e0;
-                font-size: 0.88em;
-                table-layout: fixed;
-            }
-            .rings-table th {
-                background: #f6f8fa;
-                color: #222;
-                font-weight: 600;
-                padding: 10px 12px;
-                border-bottom: 1.5px solid #eaecef;
-                border-right: 1px solid #e0e0e0;
-                white-space: normal;
-                word-wrap: break-word;
-            }
-            .rings-table td {
-                padding: 8px 12px;
-                border-bottom: 1px solid #f0f0f0;
-                color: #222;
-                border-right: 1px solid #e0e0e0;
-                text-align: center;
-                white-space: normal;
-                word-wrap: break-word;
-            }
-            .rings-table th:first-child,
-            .rings-table td:first-child {
-                width: 75px;
-            }
-            </style>
             <div class="rings-table-wrapper">
             <table class="rings-table">
             <tr>
@@ -1018,98 +925,38 @@ with tab1:
         summary_data_list.append({"Показатель": "Условная гибкость", "Значение": "N/A"})
 
     if summary_data_list:
-        summary_table_html = '''
-        <style>
-        .summary-table {
-            width: 100%;
-            border-collapse: separate;
-            border-spacing: 0;
-            background: #fff;
-            border-radius: 8px;
-            box-shadow: 0 1px 6px 0 rgba(0,0,0,0.04);
-            border: 1px solid #e0e0e0;
-            font-size: 1.08em;
-        }
-        .summary-table th {
-            background: #f6f8fa;
-            color: #222;
-            font-weight: 600;
-            padding: 12px 18px;
-            border-bottom: 1.5px solid #eaecef;
-            border-right: 1px solid #e0e0e0;
-        }
-        .summary-table th:last-child {
-            border-right: none;
-        }
-        .summary-table td {
-            padding: 10px 18px;
-            border-bottom: 1px solid #f0f0f0;
-            color: #222;
-            border-right: 1px solid #e0e0e0;
-        }
-        .summary-table td:last-child {
-            border-right: none;
-        }
-        .summary-table tr:last-child td {
-            border-bottom: none;
-        }
-        /* Скругление и обводка только на внешних углах */
-        .summary-table tr:first-child th:first-child {
-            border-top-left-radius: 8px;
-            border-left: 1px solid #e0e0e0;
-            border-top: 1px solid #e0e0e0;
-        }
-        .summary-table tr:first-child th:last-child {
-            border-top-right-radius: 8px;
-            border-right: 1px solid #e0e0e0;
-            border-top: 1px solid #e0e0e0;
-        }
-        .summary-table tr:last-child td:first-child {
-            border-bottom-left-radius: 8px;
-            border-left: 1px solid #e0e0e0;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        .summary-table tr:last-child td:last-child {
-            border-bottom-right-radius: 8px;
-            border-right: 1px solid #e0e0e0;
-            border-bottom: 1px solid #e0e0e0;
-        }
-        .summary-table tr:hover td {
-            background: #f0f6ff;
-            transition: background 0.2s;
-        }
-        </style>
-        <table class="summary-table">
-            <tr><th>Показатель</th><th>Значение</th></tr>
-        '''
-        for row in summary_data_list:
-            summary_table_html += f'<tr><td>{row["Показатель"]}</td><td>{row["Значение"]}</td></tr>'
-        summary_table_html += '</table>'
-        st.markdown(summary_table_html, unsafe_allow_html=True)
+        summary_df = pd.DataFrame(summary_data_list).set_index("Показатель")
+        st.table(
+            summary_df.style
+            .set_uuid("summary")
+            .set_table_styles(SUMMARY_TABLE_STYLES)
+        )
 
 with tab2:
     # --- Центрированный заголовок графика ---
     st.markdown('<div style="text-align:center; font-size:1.25em; font-weight:700; font-family:Segoe UI, Arial, sans-serif; margin-bottom:0.5em;">График несущей способности от времени</div>', unsafe_allow_html=True)
 
     if closest_data and N_final_list and times:
+        times_arr = np.asarray(times)
+        capacity_arr = np.asarray(N_final_list)
         chart_df = pd.DataFrame({
-            "Время, мин": times,
-            "Несущая способность, кН": N_final_list
+            "Время, мин": times_arr,
+            "Несущая способность, кН": capacity_arr
         })
-        chart_df = chart_df.set_index("Время, мин").reset_index()
         # --- Поиск предела огнестойкости ---
+        # Первый интервал, на котором несущая способность опускается ниже нагрузки
         fire_limit_time = None
-        for i in range(1, len(chart_df)):
-            prev = chart_df.iloc[i-1]
-            curr = chart_df.iloc[i]
-            if prev["Несущая способность, кН"] >= normative_load and curr["Несущая способность, кН"] < normative_load:
-                t1, t2 = prev["Время, мин"], curr["Время, мин"]
-                n1, n2 = prev["Несущая способность, кН"], curr["Несущая способность, кН"]
-                if n1 != n2:
-                    fire_limit_time = t1 + (normative_load - n1) * (t2 - t1) / (n2 - n1)
-                else:
-                    fire_limit_time = t1
-                break
+        crossings = np.flatnonzero(
+            (capacity_arr[:-1] >= normative_load) & (capacity_arr[1:] < normative_load)
+        )
+        if crossings.size:
+            i = crossings[0] + 1
+            t1, t2 = float(times_arr[i-1]), float(times_arr[i])
+            n1, n2 = float(capacity_arr[i-1]), float(capacity_arr[i])
+            if n1 != n2:
+                fire_limit_time = t1 + (normative_load - n1) * (t2 - t1) / (n2 - n1)
+            else:
+                fire_limit_time = t1
         # Основная линия
         line = alt.Chart(chart_df).mark_line(point=True, color="#d62728", strokeWidth=3).encode(
             x=alt.X("Время, мин", axis=alt.Axis(title="Время огневого воздействия, мин", titleFontSize=16)),
@@ -1229,17 +1076,8 @@ with tab_walkthrough:
             t_sec = t_min * 60
             
             # 1. Определяем температуры
-            current_record = None
-            if closest_data:
-                # Ищем запись <= текущему времени
-                suitable = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float)) and r.get('time_minutes') <= t_sec]
-                if suitable:
-                    current_record = max(suitable, key=lambda x: x.get('time_minutes'))
-                else:
-                    # Если время 0 или данных нет, берем самую первую
-                    all_recs = [r for r in closest_data if isinstance(r.get('time_minutes'), (int, float))]
-                    if all_recs:
-                        current_record = min(all_recs, key=lambda x: x.get('time_minutes'))
+            # Запись <= текущему времени, иначе самая первая
+            current_record = pick_thermal_record(closest_data, t_sec)
             
             if not current_record:
                 st.warning(f"Нет температурных данных для времени {t_min} мин")
@@ -1257,9 +1095,7 @@ with tab_walkthrough:
             # Получаем температуры колец
             temp_list = []
             if current_record:
-                mapping = {0:'temp_t2', 1:'temp_t3', 2:'temp_t5', 3:'temp_t6', 4:'temp_t7', 5:'temp_t8', 6:'temp_t9'}
-                for i in range(7):
-                    temp_list.append(current_record.get(mapping.get(i)))
+                temp_list = [current_record.get(key) for key in RING_TEMP_KEYS]
 
             # Helper for scientific notation
             def fmt_sci(val):
@@ -1446,25 +1282,23 @@ with tab4:
         # Подготовка данных для графика температур
         temp_data_list = []
         for r in closest_data:
-            t = r.get('time_minutes')
-            if isinstance(t, (int, float)):
-                item = {'Время, мин': t / 60.0}
-                # Собираем температуры
-                for k, label in [
-                    ('temp_t1', 'Сталь (t1)'),
-                    ('temp_t2', 'Б1 (t2)'),
-                    ('temp_t3', 'Б2 (t3)'),
-                    ('temp_t4', 'Арматура (t4)'),
-                    ('temp_t5', 'Б3 (t5)'),
-                    ('temp_t6', 'Б4 (t6)'),
-                    ('temp_t7', 'Б5 (t7)'),
-                    ('temp_t8', 'Б6 (t8)'),
-                    ('temp_t9', 'Б7 (t9)'),
-                ]:
-                    val = r.get(k)
-                    if val is not None:
-                        item[label] = val
-                temp_data_list.append(item)
+            item = {'Время, мин': r['time_minutes'] / 60.0}
+            # Собираем температуры
+            for k, label in [
+                ('temp_t1', 'Сталь (t1)'),
+                ('temp_t2', 'Б1 (t2)'),
+                ('temp_t3', 'Б2 (t3)'),
+                ('temp_t4', 'Арматура (t4)'),
+                ('temp_t5', 'Б3 (t5)'),
+                ('temp_t6', 'Б4 (t6)'),
+                ('temp_t7', 'Б5 (t7)'),
+                ('temp_t8', 'Б6 (t8)'),
+                ('temp_t9', 'Б7 (t9)'),
+            ]:
+                val = r.get(k)
+                if val is not None:
+                    item[label] = val
+            temp_data_list.append(item)
         
         if temp_data_list:
             df_temps = pd.DataFrame(temp_data_list)
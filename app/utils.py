@@ -8,11 +8,48 @@
 - Расчёта деформаций бетона
 """
 
+import bisect
 import math
-from typing import Dict, List, Optional
-from .config import MATERIAL_CONSTANTS
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
+from .config import MATERIAL_CONSTANTS
 
+try:
+    from numba import njit
+except ImportError:  # numba не установлен — ядра выполняются интерпретатором
+    def njit(*args, **kwargs):
+        """Заглушка декоратора numba.njit: возвращает функцию без изменений."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Поля результата discretize_concrete_core_into_rings
+RING_FIELDS = ('outer_radius_mm', 'inner_radius_mm', 'area_mm2', 'temperature_celsius')
+
+# Ключи температур колец по номеру кольца:
+# Б1->temp_t2, Б2->temp_t3, Б3->temp_t5, Б4->temp_t6,
+# Б5->temp_t7, Б6->temp_t8, Б7->temp_t9
+RING_TEMP_KEYS = ('temp_t2', 'temp_t3', 'temp_t5', 'temp_t6', 'temp_t7', 'temp_t8', 'temp_t9')
+
+# Индексы температурных данных по id() списка:
+# id -> (исходный список, отсортированные времена, соответствующие записи,
+# кэш найденных записей {время: запись}).
+# Ссылка на исходный список не даёт id освободиться и быть переиспользованным.
+_THERMAL_REGISTRY: Dict[
+    int, Tuple[List[Dict], List[float], List[Dict], Dict[float, Optional[Dict]]]
+] = {}
+_THERMAL_REGISTRY_MAX = 128
+# Предел кэша найденных записей одного списка
+_FOUND_RECORDS_MAX = 4096
+# Маркер отсутствия записи в кэше найденных записей
+_MISSING = object()
+
+
+@lru_cache(maxsize=2048)
 def calc_section(diameter_mm: float, thickness_mm: float) -> tuple[float, float]:
     """
     Расчёт площадей стального и бетонного сечений.
@@ -26,18 +63,19 @@ def calc_section(diameter_mm: float, thickness_mm: float) -> tuple[float, float]
         - A_steel_m2: Площадь стального кольца в м²
         - A_concrete_m2: Площадь бетонного ядра в м²
     """
-    D_m = diameter_mm / 1000
-    t_m = thickness_mm / 1000
+    r_out = diameter_mm * 0.5 / 1000
+    r_in = r_out - thickness_mm / 1000
 
     # Площадь стального кольца
-    A_steel = math.pi * ((D_m/2)**2 - ((D_m/2) - t_m)**2)
+    A_steel = math.pi * (r_out * r_out - r_in * r_in)
 
     # Площадь бетонного ядра
-    A_conc = math.pi * ((D_m/2 - t_m)**2)
+    A_conc = math.pi * r_in * r_in
 
     return A_steel, A_conc
 
 
+@lru_cache(maxsize=2048)
 def calc_capacity(
     A_steel_m2: float,
     A_conc_m2: float,
@@ -59,6 +97,153 @@ def calc_capacity(
     return concrete_strength_mpa * A_conc_m2 * 1e6 + steel_strength_mpa * A_steel_m2 * 1e6
 
 
+def build_thermal_index(thermal_data: List[Dict]) -> Tuple[List[float], List[Dict]]:
+    """
+    Построение индекса температурных данных для бинарного поиска по времени.
+
+    Записи без корректного времени отбрасываются, остальные сортируются
+    по возрастанию времени. Для повторяющихся значений времени остаётся
+    первая запись.
+
+    Args:
+        thermal_data: Список температурных данных
+
+    Returns:
+        Кортеж (times, records) отсортированных времён и записей
+    """
+    valid_records = [
+        r for r in thermal_data
+        if isinstance(r.get('time_minutes'), (int, float))
+    ]
+
+    times: List[float] = []
+    records: List[Dict] = []
+    for record in sorted(valid_records, key=lambda x: x['time_minutes']):
+        if times and times[-1] == record['time_minutes']:
+            continue
+        times.append(record['time_minutes'])
+        records.append(record)
+
+    return times, records
+
+
+def _thermal_index(
+    thermal_data: List[Dict]
+) -> Tuple[List[float], List[Dict], Dict[float, Optional[Dict]]]:
+    """
+    Индекс температурных данных из реестра по id() списка.
+
+    Расчёт по времени вызывает поиск записи многократно для одних и тех же
+    списков, поэтому индекс строится один раз. Списки считаются неизменяемыми.
+
+    Returns:
+        Кортеж (times, records, found): отсортированные времена, записи и
+        кэш уже найденных записей {время: запись}
+    """
+    entry = _THERMAL_REGISTRY.get(id(thermal_data))
+    if entry is not None and entry[0] is thermal_data:
+        return entry[1], entry[2], entry[3]
+
+    if len(_THERMAL_REGISTRY) >= _THERMAL_REGISTRY_MAX:
+        clear_thermal_index_cache()
+
+    times, records = build_thermal_index(thermal_data)
+    found: Dict[float, Optional[Dict]] = {}
+    _THERMAL_REGISTRY[id(thermal_data)] = (thermal_data, times, records, found)
+    return times, records, found
+
+
+def clear_thermal_index_cache() -> None:
+    """Сброс реестра индексов температурных данных вместе с кэшами поиска."""
+    _THERMAL_REGISTRY.clear()
+
+
+def pick_thermal_record(
+    thermal_data: List[Dict],
+    fire_exposure_time_sec: float
+) -> Optional[Dict]:
+    """
+    Получить запись температурных данных для заданного времени.
+
+    Выбирается запись с максимальным временем, не превышающим заданное.
+    Если такой записи нет, выбирается запись с минимальным временем.
+    Поиск выполняется бинарным поиском по отсортированному индексу,
+    результат кэшируется для каждого списка по времени.
+
+    Индекс и кэш берутся из реестра один раз и дальше используются через
+    локальные ссылки, поэтому сброс реестра из другого потока (сессии
+    Streamlit выполняются в потоках) не мешает уже начатому поиску.
+
+    Args:
+        thermal_data: Список температурных данных
+        fire_exposure_time_sec: Время пожара в секундах
+
+    Returns:
+        Словарь с температурными данными или None
+    """
+    if not thermal_data:
+        return None
+
+    times, records, found = _thermal_index(thermal_data)
+    # Одно обращение к кэшу: между проверкой и чтением другой поток мог бы
+    # его очистить. None — допустимое закэшированное значение, поэтому маркер
+    record = found.get(fire_exposure_time_sec, _MISSING)
+    if record is not _MISSING:
+        return record
+
+    if not records:
+        record = None
+    else:
+        idx = bisect.bisect_right(times, fire_exposure_time_sec) - 1
+        record = records[idx] if idx >= 0 else records[0]
+
+    if len(found) >= _FOUND_RECORDS_MAX:
+        found.clear()
+    found[fire_exposure_time_sec] = record
+    return record
+
+
+@njit(cache=True)
+def _build_rings(
+    outer_radius_mm: float,
+    thicknesses_mm: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Геометрия концентрических колец (компилируется numba).
+
+    Args:
+        outer_radius_mm: Внешний радиус бетонного ядра в мм
+        thicknesses_mm: Толщины колец в мм (от внешнего к внутреннему),
+                        NaN означает "занять весь остаток"
+
+    Returns:
+        Кортеж массивов (outer_radius_mm, inner_radius_mm, area_mm2)
+    """
+    num_rings = thicknesses_mm.shape[0]
+    outer_radii = np.empty(num_rings)
+    inner_radii = np.empty(num_rings)
+    areas = np.empty(num_rings)
+
+    current_outer_radius = outer_radius_mm
+    for i in range(num_rings):
+        thickness_ring_mm = thicknesses_mm[i]
+        if np.isnan(thickness_ring_mm):
+            thickness_ring_mm = current_outer_radius
+
+        inner_radius = max(0.0, current_outer_radius - thickness_ring_mm)
+
+        outer_radii[i] = current_outer_radius
+        inner_radii[i] = inner_radius
+        if current_outer_radius > inner_radius:
+            areas[i] = math.pi * (current_outer_radius**2 - inner_radius**2)
+        else:
+            areas[i] = 0.0
+
+        current_outer_radius = inner_radius
+
+    return outer_radii, inner_radii, areas
+
+
 def discretize_concrete_core_into_rings(
     diameter_mm: float,
     thickness_mm: float,
@@ -66,7 +251,7 @@ def discretize_concrete_core_into_rings(
     fire_exposure_time_sec: float,
     num_rings: int = 7,
     ring_thicknesses: Optional[List[Optional[float]]] = None
-) -> List[Dict]:
+) -> Dict[str, np.ndarray]:
     """
     Дискретизация бетонного ядра на концентрические кольца.
 
@@ -83,33 +268,17 @@ def discretize_concrete_core_into_rings(
                           None для последнего кольца означает "занять весь остаток"
 
     Returns:
-        Список словарей с параметрами колец:
-        - outer_radius_mm: Внешний радиус кольца в мм
-        - inner_radius_mm: Внутренний радиус кольца в мм
-        - area_mm2: Площадь кольца в мм²
-        - temperature_celsius: Температура кольца в °C
+        Словарь массивов параметров колец (по одному элементу на кольцо):
+        - outer_radius_mm: Внешние радиусы колец в мм
+        - inner_radius_mm: Внутренние радиусы колец в мм
+        - area_mm2: Площади колец в мм²
+        - temperature_celsius: Температуры колец в °C (NaN, если нет данных)
     """
     if not thermal_data:
-        return []
+        return {field: np.empty(0) for field in RING_FIELDS}
 
     # Находим подходящую запись температурных данных
-    suitable_records = [
-        r for r in thermal_data
-        if isinstance(r.get('time_minutes'), (int, float))
-        and r.get('time_minutes', -1) <= fire_exposure_time_sec
-    ]
-
-    if suitable_records:
-        thermal_record = max(suitable_records, key=lambda x: x.get('time_minutes', -1))
-    else:
-        all_time_records = [
-            r for r in thermal_data
-            if isinstance(r.get('time_minutes'), (int, float))
-        ]
-        if all_time_records:
-            thermal_record = min(all_time_records, key=lambda x: x.get('time_minutes', float('inf')))
-        else:
-            thermal_record = None
+    thermal_record = pick_thermal_record(thermal_data, fire_exposure_time_sec)
 
     # Радиусы
     column_radius_mm = diameter_mm / 2.0
@@ -120,58 +289,56 @@ def discretize_concrete_core_into_rings(
         total_thickness = concrete_core_outer_radius_mm
         ring_thicknesses = [total_thickness / num_rings] * num_rings
 
-    rings = []
-    current_outer_radius = concrete_core_outer_radius_mm
-
-    for i in range(num_rings):
-        # Определяем толщину текущего кольца
-        if i < len(ring_thicknesses) and ring_thicknesses[i] is not None:
-            thickness_ring_mm = ring_thicknesses[i]
-        else:
-            # Если толщина не задана, используем оставшееся пространство
-            thickness_ring_mm = current_outer_radius
+    # NaN означает "занять весь остаток" (None или отсутствующее значение)
+    thicknesses_mm = np.full(num_rings, np.nan)
+    given_thicknesses = ring_thicknesses[:num_rings]
+    thicknesses_mm[:len(given_thicknesses)] = np.array(given_thicknesses, dtype=float)
 
-        # Вычисляем внутренний радиус
-        inner_radius = max(0.0, current_outer_radius - thickness_ring_mm)
+    outer_radii, inner_radii, areas = _build_rings(
+        float(concrete_core_outer_radius_mm), thicknesses_mm
+    )
 
-        # Вычисляем площадь кольца
-        area = (
-            math.pi * (current_outer_radius**2 - inner_radius**2)
-            if current_outer_radius > inner_radius
-            else 0.0
+    # Температуры колец; None и кольца сверх Б7 дают NaN
+    temperatures = np.full(num_rings, np.nan)
+    if thermal_record:
+        ring_temp_keys = RING_TEMP_KEYS[:num_rings]
+        temperatures[:len(ring_temp_keys)] = np.array(
+            [thermal_record.get(key) for key in ring_temp_keys], dtype=float
         )
 
-        # Определяем температуру для кольца на основе номера
-        # Маппинг: Б1->temp_t2, Б2->temp_t3, Б3->temp_t5, Б4->temp_t6,
-        #          Б5->temp_t7, Б6->temp_t8, Б7->temp_t9
-        temp = None
-        if thermal_record:
-            temperature_mapping = {
-                0: 'temp_t2',  # Б1
-                1: 'temp_t3',  # Б2
-                2: 'temp_t5',  # Б3
-                3: 'temp_t6',  # Б4
-                4: 'temp_t7',  # Б5
-                5: 'temp_t8',  # Б6
-                6: 'temp_t9',  # Б7
-            }
-            temp_key = temperature_mapping.get(i)
-            if temp_key:
-                temp = thermal_record.get(temp_key)
-
-        rings.append({
-            'outer_radius_mm': current_outer_radius,
-            'inner_radius_mm': inner_radius,
-            'area_mm2': area,
-            'temperature_celsius': temp
-        })
-
-        # Обновляем внешний радиус для следующего кольца
-        current_outer_radius = inner_radius
+    return {
+        'outer_radius_mm': outer_radii,
+        'inner_radius_mm': inner_radii,
+        'area_mm2': areas,
+        'temperature_celsius': temperatures
+    }
 
-    return rings
 
+def rings_as_list_of_dicts(rings: Dict[str, np.ndarray]) -> List[Dict]:
+    """
+    Преобразование колец из словаря массивов в список словарей.
+
+    Используется там, где кольца обрабатываются поштучно (таблицы UI).
+
+    Args:
+        rings: Результат discretize_concrete_core_into_rings
 
+    Returns:
+        Список словарей с ключами RING_FIELDS; отсутствующая
+        температура (NaN) заменяется на None
+    """
+    return [
+        {
+            'outer_radius_mm': float(outer),
+            'inner_radius_mm': float(inner),
+            'area_mm2': float(area),
+            'temperature_celsius': None if math.isnan(temp) else float(temp)
+        }
+        for outer, inner, area, temp in zip(*(rings[field] for field in RING_FIELDS))
+    ]
+
+
+@lru_cache(maxsize=2048)
 def steel_ring_area(diameter_mm: float, thickness_mm: float) -> float:
     """
     Расчёт площади стального кольца.
@@ -183,11 +350,64 @@ def steel_ring_area(diameter_mm: float, thickness_mm: float) -> float:
     Returns:
         Площадь стального кольца в мм²
     """
-    R_out = diameter_mm / 2
+    R_out = diameter_mm * 0.5
     R_in = R_out - thickness_mm
-    return math.pi * (R_out**2 - R_in**2)
+    return math.pi * (R_out * R_out - R_in * R_in)
+
+
+# Табличные значения γ_st из СП 468.1325800.2019, таблица 5.1, на сетке
+# 100..1200°C с шагом 100°C. Значение при 20°C совпадает со значением
+# при 100°C, поэтому ниже 100°C коэффициент постоянен
+_STEEL_T = (100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 1100, 1200)
+_STEEL_K = (1.00, 0.90, 0.80, 0.70, 0.60, 0.31, 0.13, 0.09, 0.0675, 0.0450, 0.0225, 0.0)
+
+# Табличные значения γ_bt из СП 468.1325800.2019 на той же сетке
+_CONCRETE_T = (100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 1100, 1200)
+_CONCRETE_K = (1.00, 0.95, 0.85, 0.75, 0.60, 0.45, 0.30, 0.15, 0.08, 0.04, 0.01, 0.0)
+
+# Табличные значения деформаций ε_yn,t (×10⁻³); выше 1100°C бетон
+# считается полностью разрушенным
+_STRAIN_T = (20, 100, 200, 300, 400, 500, 600, 700, 800, 900, 1000, 1100)
+_STRAIN_E = (2.5, 4.0, 5.5, 7.0, 10.0, 15.0, 25.0, 25.0, 25.0, 25.0, 25.0, 25.0)
+
+
+def _interp_grid(temp_celsius: float, values: Tuple) -> float:
+    """
+    Линейная интерполяция по таблице на сетке 100, 200, ... °C.
+
+    Args:
+        temp_celsius: Температура в °C в пределах [100, 100·len(values))
+        values: Табличные значения в узлах сетки
 
+    Returns:
+        Интерполированное значение
+    """
+    x = (temp_celsius - 100) / 100
+    i = int(x)
+    k0 = values[i]
+    return k0 + (values[i+1] - k0) * (x - i)
+
+
+def _interp_uniform(temp_celsius: float, temps: Tuple, values: Tuple) -> float:
+    """
+    Линейная интерполяция по таблице с равномерным шагом 100°C
+    (первая точка — 20°C) без поиска интервала.
+
+    Args:
+        temp_celsius: Температура в °C в пределах [temps[0], temps[-1])
+        temps: Табличные температуры
+        values: Табличные значения
 
+    Returns:
+        Интерполированное значение
+    """
+    i = int(temp_celsius // 100) + 1 if temp_celsius >= 100 else 1
+    t0 = temps[i-1]
+    k0 = values[i-1]
+    return k0 + (values[i] - k0) * (temp_celsius - t0) / (temps[i] - t0)
+
+
+@lru_cache(maxsize=2048)
 def steel_working_condition_coeff(temp_celsius: float) -> float:
     """
     Коэффициент условий работы стали при повышенных температурах γ_st.
@@ -204,39 +424,16 @@ def steel_working_condition_coeff(temp_celsius: float) -> float:
     Returns:
         Коэффициент условий работы γ_st (безразмерный)
     """
-    # Табличные значения из СП 468.1325800.2019
-    table = [
-        (20, 1.00),
-        (100, 1.00),
-        (200, 0.90),
-        (300, 0.80),
-        (400, 0.70),
-        (500, 0.60),
-        (600, 0.31),
-        (700, 0.13),
-        (800, 0.09),
-        (900, 0.0675),
-        (1000, 0.0450),
-        (1100, 0.0225),
-        (1200, 0.0),
-    ]
-
-    # Проверка границ
-    if temp_celsius <= table[0][0]:
-        return table[0][1]
-    if temp_celsius >= table[-1][0]:
-        return table[-1][1]
+    # Проверка границ (NaN попадает в верхнюю)
+    if temp_celsius <= _STEEL_T[0]:
+        return _STEEL_K[0]
+    if not temp_celsius < _STEEL_T[-1]:
+        return _STEEL_K[-1]
 
-    # Линейная интерполяция
-    for i in range(1, len(table)):
-        t0, k0 = table[i-1]
-        t1, k1 = table[i]
-        if t0 <= temp_celsius <= t1:
-            return k0 + (k1 - k0) * (temp_celsius - t0) / (t1 - t0)
-
-    return table[-1][1]
+    return _interp_grid(temp_celsius, _STEEL_K)
 
 
+@lru_cache(maxsize=2048)
 def concrete_working_condition_coeff(temp_celsius: float) -> float:
     """
     Коэффициент условий работы бетона при повышенных температурах γ_bt.
@@ -252,39 +449,16 @@ def concrete_working_condition_coeff(temp_celsius: float) -> float:
     Returns:
         Коэффициент условий работы γ_bt (безразмерный)
     """
-    # Табличные значения из СП 468.1325800.2019
-    table = [
-        (20, 1.00),
-        (100, 1.00),
-        (200, 0.95),
-        (300, 0.85),
-        (400, 0.75),
-        (500, 0.60),
-        (600, 0.45),
-        (700, 0.30),
-        (800, 0.15),
-        (900, 0.08),
-        (1000, 0.04),
-        (1100, 0.01),
-        (1200, 0.0),
-    ]
-
-    # Проверка границ
-    if temp_celsius <= table[0][0]:
-        return table[0][1]
-    if temp_celsius >= table[-1][0]:
-        return table[-1][1]
+    # Проверка границ (NaN попадает в верхнюю)
+    if temp_celsius <= _CONCRETE_T[0]:
+        return _CONCRETE_K[0]
+    if not temp_celsius < _CONCRETE_T[-1]:
+        return _CONCRETE_K[-1]
 
-    # Линейная интерполяция
-    for i in range(1, len(table)):
-        t0, k0 = table[i-1]
-        t1, k1 = table[i]
-        if t0 <= temp_celsius <= t1:
-            return k0 + (k1 - k0) * (temp_celsius - t0) / (t1 - t0)
-
-    return table[-1][1]
+    return _interp_grid(temp_celsius, _CONCRETE_K)
 
 
+@lru_cache(maxsize=2048)
 def concrete_strain_by_temp(temp_celsius: float) -> Optional[float]:
     """
     Деформация бетона при заданной температуре ε_yn,t.
@@ -298,88 +472,77 @@ def concrete_strain_by_temp(temp_celsius: float) -> Optional[float]:
         temp_celsius: Температура бетона в °C
 
     Returns:
-        Деформация в тысячных долях (×10⁻³) или None при T≥1200°C
-    """
-    # Табличные значения деформаций
-    table = [
-        (20, 2.5),
-        (100, 4.0),
-        (200, 5.5),
-        (300, 7.0),
-        (400, 10.0),
-        (500, 15.0),
-        (600, 25.0),
-        (700, 25.0),
-        (800, 25.0),
-        (900, 25.0),
-        (1000, 25.0),
-        (1100, 25.0),
-        (1200, None),  # При 1200°C бетон полностью разрушен
-    ]
-
+        Деформация в тысячных долях (×10⁻³) или None при T>1100°C
+    """
     # Проверка нижней границы
-    if temp_celsius < 20:
-        return 2.5
+    if temp_celsius < _STRAIN_T[0]:
+        return _STRAIN_E[0]
+    # При 1200°C бетон полностью разрушен (NaN также даёт None)
+    if not temp_celsius <= _STRAIN_T[-1]:
+        return None
+    if temp_celsius == _STRAIN_T[-1]:
+        return _STRAIN_E[-1]
 
-    # Линейная интерполяция
-    for i in range(1, len(table)):
-        t0, e0 = table[i-1]
-        t1, e1 = table[i]
-        if temp_celsius <= t1:
-            if e1 is None:
-                return None
-            return e0 + (e1 - e0) * (temp_celsius - t0) / (t1 - t0)
+    return _interp_uniform(temp_celsius, _STRAIN_T, _STRAIN_E)
 
-    return None
 
+# Таблицы γ_bt и ε_yn,t в виде массивов для векторной интерполяции
+_CONCRETE_T_ARR = np.array(_CONCRETE_T, dtype=np.float64)
+_CONCRETE_K_ARR = np.array(_CONCRETE_K, dtype=np.float64)
+_STRAIN_T_ARR = np.array(_STRAIN_T, dtype=np.float64)
+_STRAIN_E_ARR = np.array(_STRAIN_E, dtype=np.float64)
 
-def calculate_steel_ring(
+
+def concrete_coeffs_vec(temps_celsius: np.ndarray) -> np.ndarray:
+    """
+    Коэффициенты условий работы бетона γ_bt для массива температур.
+
+    Векторный аналог concrete_working_condition_coeff: одна интерполяция
+    np.interp на все кольца с ограничением значениями на краях таблицы.
+
+    Args:
+        temps_celsius: Массив температур бетона в °C (без NaN)
+
+    Returns:
+        Массив коэффициентов γ_bt
+    """
+    return np.interp(temps_celsius, _CONCRETE_T_ARR, _CONCRETE_K_ARR)
+
+
+def concrete_strains_vec(temps_celsius: np.ndarray) -> np.ndarray:
+    """
+    Деформации бетона ε_yn,t для массива температур.
+
+    Векторный аналог concrete_strain_by_temp.
+
+    Args:
+        temps_celsius: Массив температур бетона в °C (без NaN)
+
+    Returns:
+        Массив деформаций в тысячных долях (×10⁻³); NaN при T>1100°C
+    """
+    strains = np.interp(temps_celsius, _STRAIN_T_ARR, _STRAIN_E_ARR)
+    return np.where(temps_celsius > _STRAIN_T[-1], np.nan, strains)
+
+
+def _steel_ring_geometry(
     diameter_mm: float,
     thickness_mm: float,
-    thermal_data: List[Dict],
-    fire_exposure_time_sec: float,
-    rebar_diameter_mm: int
-) -> Optional[Dict]:
+    rebar_diameter_mm: float,
+    rebar_cover_mm: float
+) -> Tuple[float, float, float, float]:
     """
-    Расчёт параметров стального кольца.
+    Геометрия стального кольца с учётом арматуры.
 
     Args:
         diameter_mm: Наружный диаметр колонны в мм
         thickness_mm: Толщина стенки в мм
-        thermal_data: Список температурных данных
-        fire_exposure_time_sec: Время пожара в секундах
         rebar_diameter_mm: Диаметр арматуры в мм
+        rebar_cover_mm: Защитный слой бетона до арматуры в мм
 
     Returns:
-        Словарь с параметрами стального кольца или None:
-        - outer_radius_mm: Внешний радиус
-        - inner_radius_mm: Внутренний радиус
-        - area_mm2: Площадь
-        - moment_of_inertia_mm4: Момент инерции
-        - temperature_celsius: Температура
+        Кортеж (outer_radius_mm, inner_radius_mm, area_mm2, moment_of_inertia_mm4)
     """
-    if not thermal_data:
-        return None
-
-    # Находим подходящую запись температурных данных
-    suitable_records = [
-        r for r in thermal_data
-        if isinstance(r.get('time_minutes'), (int, float))
-        and r.get('time_minutes', -1) <= fire_exposure_time_sec
-    ]
-
-    if suitable_records:
-        thermal_record = max(suitable_records, key=lambda x: x.get('time_minutes', -1))
-    else:
-        all_time_records = [
-            r for r in thermal_data
-            if isinstance(r.get('time_minutes'), (int, float))
-        ]
-        if all_time_records:
-            thermal_record = min(all_time_records, key=lambda x: x.get('time_minutes', float('inf')))
-        else:
-            thermal_record = None
-
     # Радиусы стального кольца
     column_radius_mm = diameter_mm / 2.0
     steel_ring_outer_radius_mm = column_radius_mm
@@ -395,21 +558,58 @@ def calculate_steel_ring(
     # Расстояние от центра до арматуры с учётом защитного слоя
     rebar_distance_mm = (
         column_radius_mm - thickness_mm
-        - MATERIAL_CONSTANTS.REBAR_COVER_MM
+        - rebar_cover_mm
         - (rebar_diameter_mm / 2)
     )
 
-    sin_45 = math.sin(math.radians(45))
-
-    # Формула момента инерции для 8 стержней, расположенных по окружности
+    # Формула момента инерции для 8 стержней, расположенных по окружности:
+    # 2·A·(a² + (a·sin45°)² + (a·sin45°)²) = 2·(π·d²/4)·2·a² = π·d²·a²
     I_rebar = (
-        2 * (math.pi * rebar_diameter_mm * rebar_diameter_mm / 4)
-        * (rebar_distance_mm**2 + (rebar_distance_mm * sin_45)**2 + (rebar_distance_mm * sin_45)**2)
+        math.pi * rebar_diameter_mm * rebar_diameter_mm
+        * rebar_distance_mm * rebar_distance_mm
     ) * 1e-12
 
     # Общий момент инерции
     I_total = I_ring + I_rebar
 
+    return steel_ring_outer_radius_mm, steel_ring_inner_radius_mm, area, I_total
+
+
+def calculate_steel_ring(
+    diameter_mm: float,
+    thickness_mm: float,
+    thermal_data: List[Dict],
+    fire_exposure_time_sec: float,
+    rebar_diameter_mm: int
+) -> Optional[Dict]:
+    """
+    Расчёт параметров стального кольца.
+
+    Args:
+        diameter_mm: Наружный диаметр колонны в мм
+        thickness_mm: Толщина стенки в мм
+        thermal_data: Список температурных данных
+        fire_exposure_time_sec: Время пожара в секундах
+        rebar_diameter_mm: Диаметр арматуры в мм
+
+    Returns:
+        Словарь с параметрами стального кольца или None:
+        - outer_radius_mm: Внешний радиус
+        - inner_radius_mm: Внутренний радиус
+        - area_mm2: Площадь
+        - moment_of_inertia_mm4: Момент инерции
+        - temperature_celsius: Температура
+    """
+    if not thermal_data:
+        return None
+
+    # Находим подходящую запись температурных данных
+    thermal_record = pick_thermal_record(thermal_data, fire_exposure_time_sec)
+
+    steel_ring_outer_radius_mm, steel_ring_inner_radius_mm, area, I_total = _steel_ring_geometry(
+        diameter_mm, thickness_mm, rebar_diameter_mm, MATERIAL_CONSTANTS.REBAR_COVER_MM
+    )
+
     # Определяем температуру стального кольца
     temp = thermal_record.get('temp_t1') if thermal_record else None
 
@@ -5,6 +5,14 @@
 from typing import Tuple
 from .config import GEOMETRY_LIMITS
 
+# Границы геометрии, связанные один раз при импорте
+_MIN_D = GEOMETRY_LIMITS.MIN_DIAMETER_MM
+_MAX_D = GEOMETRY_LIMITS.MAX_DIAMETER_MM
+_MIN_T = GEOMETRY_LIMITS.MIN_THICKNESS_MM
+_MAX_T = GEOMETRY_LIMITS.MAX_THICKNESS_MM
+_MIN_H = GEOMETRY_LIMITS.MIN_HEIGHT_M
+_MAX_H = GEOMETRY_LIMITS.MAX_HEIGHT_M
+
 
 class ValidationError(ValueError):
     """Исключение для ошибок валидации"""
@@ -33,21 +41,21 @@ def validate_geometry(
     if diameter_mm <= 0:
         return False, "❌ Диаметр должен быть положительным числом"
 
-    if diameter_mm < GEOMETRY_LIMITS.MIN_DIAMETER_MM:
-        return False, f"❌ Диаметр не может быть меньше {GEOMETRY_LIMITS.MIN_DIAMETER_MM} мм"
+    if diameter_mm < _MIN_D:
+        return False, f"❌ Диаметр не может быть меньше {_MIN_D} мм"
 
-    if diameter_mm > GEOMETRY_LIMITS.MAX_DIAMETER_MM:
-        return False, f"❌ Диаметр не может быть больше {GEOMETRY_LIMITS.MAX_DIAMETER_MM} мм"
+    if diameter_mm > _MAX_D:
+        return False, f"❌ Диаметр не может быть больше {_MAX_D} мм"
 
     # Проверка толщины
     if thickness_mm <= 0:
         return False, "❌ Толщина стенки должна быть положительным числом"
 
-    if thickness_mm < GEOMETRY_LIMITS.MIN_THICKNESS_MM:
-        return False, f"❌ Толщина стенки не может быть меньше {GEOMETRY_LIMITS.MIN_THICKNESS_MM} мм"
+    if thickness_mm < _MIN_T:
+        return False, f"❌ Толщина стенки не может быть меньше {_MIN_T} мм"
 
-    if thickness_mm > GEOMETRY_LIMITS.MAX_THICKNESS_MM:
-        return False, f"❌ Толщина стенки не может быть больше {GEOMETRY_LIMITS.MAX_THICKNESS_MM} мм"
+    if thickness_mm > _MAX_T:
+        return False, f"❌ Толщина стенки не может быть больше {_MAX_T} мм"
 
     # Проверка соотношения толщины и диаметра
     if thickness_mm >= diameter_mm / 2:
@@ -62,11 +70,11 @@ def validate_geometry(
     if height_m <= 0:
         return False, "❌ Высота колонны должна быть положительным числом"
 
-    if height_m < GEOMETRY_LIMITS.MIN_HEIGHT_M:
-        return False, f"❌ Высота колонны не может быть меньше {GEOMETRY_LIMITS.MIN_HEIGHT_M} м"
+    if height_m < _MIN_H:
+        return False, f"❌ Высота колонны не может быть меньше {_MIN_H} м"
 
-    if height_m > GEOMETRY_LIMITS.MAX_HEIGHT_M:
-        return False, f"❌ Высота колонны не может быть больше {GEOMETRY_LIMITS.MAX_HEIGHT_M} м"
+    if height_m > _MAX_H:
+        return False, f"❌ Высота колонны не может быть больше {_MAX_H} м"
 
     return True, ""
 
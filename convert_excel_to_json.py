@@ -1,10 +1,45 @@
-import pandas as pd
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice, repeat
 from pathlib import Path
 
+import orjson
+from openpyxl import load_workbook
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine не установлен — читаем через openpyxl
+    CalamineWorkbook = None
+
+# Столбец времени в Excel файле
+TIME_COLUMN = 'Время, сек'
+
+# Маппинг столбцов Excel -> ключи JSON (пары в порядке записи)
+# temp_t1 -> Сталь
+# temp_t2 -> Б1
+# temp_t3 -> Б2
+# temp_t4 -> Армирование
+# temp_t5 -> Б3
+# ...
+COLUMN_MAPPING = (
+    ('Сталь', 'temp_t1'),
+    ('Б1', 'temp_t2'),
+    ('Б2', 'temp_t3'),
+    ('Армирование', 'temp_t4'),
+    ('Б3', 'temp_t5'),
+    ('Б4', 'temp_t6'),
+    ('Б5', 'temp_t7'),
+    ('Б6', 'temp_t8'),
+    ('Б7', 'temp_t9'),
+)
+
+# Кириллические «х»/«Х» в именах файлов заменяются латинской x
+CYRILLIC_X_TABLE = str.maketrans({'\u0445': 'x', '\u0425': 'x'})
+
+@lru_cache(maxsize=1024)
 def parse_geometry_from_filename(file_stem: str):
-    name_clean = file_stem.replace('\u0445', 'x').replace('\u0425', 'x')
+    name_clean = file_stem.translate(CYRILLIC_X_TABLE)
     parts = name_clean.split('x') if 'x' in name_clean else name_clean.split(',')
     if len(parts) < 2:
         return None
@@ -17,73 +52,137 @@ def parse_geometry_from_filename(file_stem: str):
         return None
 
 
-def convert_excel_to_json(excel_file):
+def iter_excel_rows(excel_file):
+    # Построчно отдаёт значения ячеек листа, начиная с заголовка.
+    # Пустые ячейки: None у openpyxl, '' у calamine
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(str(excel_file))
+        try:
+            yield from wb.get_sheet_by_index(0).iter_rows()
+        finally:
+            wb.close()
+        return
+
+    wb = load_workbook(excel_file, read_only=True, data_only=True)
     try:
-        # Читаем Excel файл
-        df = pd.read_excel(excel_file)
-        
-        # Выводим информацию о структуре файла
-        print(f"\nСтруктура файла {excel_file.name}:")
-        print("Столбцы:", df.columns.tolist())
-        print("Первые 2 строки:")
-        print(df.head(2))
-        
-        # Определяем маппинг столбцов
-        # temp_t1 -> Сталь
-        # temp_t2 -> Б1
-        # temp_t3 -> Б2
-        # temp_t4 -> Армирование
-        # temp_t5 -> Б3
-        # ...
-        
-        column_mapping = {
-            'Сталь': 'temp_t1',
-            'Б1': 'temp_t2',
-            'Б2': 'temp_t3',
-            'Армирование': 'temp_t4',
-            'Б3': 'temp_t5',
-            'Б4': 'temp_t6',
-            'Б5': 'temp_t7',
-            'Б6': 'temp_t8',
-            'Б7': 'temp_t9'
-        }
-        
-        # Проверяем наличие всех необходимых столбцов
-        missing_columns = [col for col in column_mapping.keys() if col not in df.columns]
-        if missing_columns:
-            print(f"Предупреждение: отсутствуют столбцы {missing_columns}")
-        
-        # Создаем список для хранения данных
-        data = []
-        
-        # Проходим по каждой строке
-        for index, row in df.iterrows():
+        # Первый лист, как и в ветке calamine (активным может быть другой)
+        yield from wb.worksheets[0].iter_rows(values_only=True)
+    finally:
+        wb.close()
+
+
+def iter_records(excel_file):
+    # Записи JSON по одной строке листа — весь файл в памяти не держится
+    try:
+        # Читаем Excel файл построчно (calamine, если установлен, иначе openpyxl)
+        rows = iter_excel_rows(excel_file)
+        try:
+            header = next(rows, ())
+            col_idx = {name: i for i, name in enumerate(header)}
+
+            # Выводим информацию о структуре файла
+            print(f"\nСтруктура файла {excel_file.name}:")
+            print("Столбцы:", list(header))
+
+            # Проверяем наличие всех необходимых столбцов
+            missing_columns = [col for col, _ in COLUMN_MAPPING if col not in col_idx]
+            if missing_columns:
+                print(f"Предупреждение: отсутствуют столбцы {missing_columns}")
+
+            # Индексы столбцов: время и имеющиеся температурные точки
+            time_idx = col_idx[TIME_COLUMN]
+            temp_columns = [
+                (json_key, col_idx[col_name])
+                for col_name, json_key in COLUMN_MAPPING
+                if col_name in col_idx
+            ]
+
+            # Проходим по каждой строке. Один try на весь цикл: при ошибке
+            # преобразования index и row указывают на проблемную строку
+            index, row = 0, ()
             try:
-                # Создаем словарь для текущей записи
-                record = {
-                    "time_minutes": int(row['Время, сек'])
-                }
-                
-                # Добавляем температурные точки согласно маппингу
-                for col_name, json_key in column_mapping.items():
-                    if col_name in row:
-                        record[json_key] = float(row[col_name])
-                    else:
-                        # Если столбца нет, можно заполнить нулем или пропустить
-                        # В данном случае лучше пропустить или вывести предупреждение
-                        pass
-                        
-                data.append(record)
-            except Exception as e:
+                for index, row in enumerate(rows):
+                    # Пустые строки (например, отформатированные ячейки в конце листа) пропускаем
+                    if all(value is None or value == '' for value in row):
+                        continue
+
+                    # Создаем словарь для текущей записи
+                    record = {
+                        "time_minutes": int(row[time_idx])
+                    }
+
+                    # Добавляем температурные точки согласно маппингу
+                    for json_key, i in temp_columns:
+                        record[json_key] = float(row[i])
+
+                    yield record
+            except (TypeError, ValueError) as e:
                 print(f"Ошибка в строке {index + 2}: {str(e)}")
-                print(f"Содержимое строки: {row.to_dict()}")
+                print(f"Содержимое строки: {dict(zip(header, row))}")
                 raise
-        
-        return data
+        finally:
+            rows.close()
     except Exception as e:
         print(f"Ошибка при обработке файла {excel_file}: {str(e)}")
         raise
 
+def convert_excel_to_json(excel_file):
+    data = list(iter_records(excel_file))
+
+    print("Первые 2 записи:")
+    print(data[:2])
+
+    return data
+
+def write_json_records(records, json_file):
+    # Пишет записи по мере чтения в том же виде, что orjson.dumps(data, OPT_INDENT_2).
+    # Файл сначала пишется во временный, чтобы при ошибке не оставить обрезанный JSON
+    tmp_file = json_file.with_name(json_file.name + '.tmp')
+    try:
+        with open(tmp_file, 'wb') as f:
+            separator = b'[\n  '
+            for record in records:
+                f.write(separator)
+                f.write(orjson.dumps(record, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n  '))
+                separator = b',\n  '
+            # Пустой список orjson записывает как []
+            f.write(b'\n]' if separator != b'[\n  ' else b'[]')
+        os.replace(tmp_file, json_file)
+    finally:
+        if tmp_file.exists():
+            tmp_file.unlink()
+
+def process_one(excel_file, json_dir):
+    # Конвертирует один Excel файл в JSON; файлы независимы, поэтому
+    # функция выполняется в отдельном процессе
+    try:
+        print(f"\nОбработка файла: {excel_file}")
+        # Получаем имя файла без расширения
+        file_name = excel_file.stem
+        geometry = parse_geometry_from_filename(file_name)
+        if geometry is None:
+            print(f"Warning: could not parse geometry from filename {excel_file.name}")
+        else:
+            diameter_val, thickness_val, rebar_val = geometry
+            if rebar_val is None:
+                print(f"Geometry: D={diameter_val} mm, t={thickness_val} mm")
+            else:
+                print(f"Geometry: D={diameter_val} mm, t={thickness_val} mm, d_arm={rebar_val} mm")
+
+        # Конвертируем Excel в JSON
+        records = iter_records(excel_file)
+        head = list(islice(records, 2))
+        print("Первые 2 записи:")
+        print(head)
+
+        # Сохраняем JSON файл, записи пишутся по мере чтения листа
+        json_file = json_dir / f"{file_name}.json"
+        write_json_records(chain(head, records), json_file)
+
+        print(f"Конвертирован файл: {excel_file.name} -> {json_file.name}")
+    except Exception as e:
+        print(f"Ошибка при обработке файла {excel_file}: {str(e)}")
+
 def main():
     try:
         # Получаем текущую директорию скрипта
@@ -96,34 +195,10 @@ def main():
         json_dir = current_dir / "thermal_data"
         json_dir.mkdir(exist_ok=True)
         
-        # Проходим по всем Excel файлам
-        for excel_file in excel_dir.glob("*.xlsx"):
-            try:
-                print(f"\nОбработка файла: {excel_file}")
-                # Получаем имя файла без расширения
-                file_name = excel_file.stem
-                geometry = parse_geometry_from_filename(file_name)
-                if geometry is None:
-                    print(f"Warning: could not parse geometry from filename {excel_file.name}")
-                else:
-                    diameter_val, thickness_val, rebar_val = geometry
-                    if rebar_val is None:
-                        print(f"Geometry: D={diameter_val} mm, t={thickness_val} mm")
-                    else:
-                        print(f"Geometry: D={diameter_val} mm, t={thickness_val} mm, d_arm={rebar_val} mm")
-                
-                # Конвертируем Excel в JSON
-                data = convert_excel_to_json(excel_file)
-                
-                # Сохраняем JSON файл
-                json_file = json_dir / f"{file_name}.json"
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=4, ensure_ascii=False)
-                
-                print(f"Конвертирован файл: {excel_file.name} -> {json_file.name}")
-            except Exception as e:
-                print(f"Ошибка при обработке файла {excel_file}: {str(e)}")
-                continue
+        # Файлы независимы — конвертируем их параллельно по процессам
+        excel_files = list(excel_dir.glob("*.xlsx"))
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(process_one, excel_files, repeat(json_dir)))
     except Exception as e:
         print(f"Общая ошибка: {str(e)}")
 
@@ -6,352 +6,151 @@ import numpy as np
 radius = 250  # 500/2 мм
 center_x, center_y = 0, 0
 
-# Создаем точки для внешнего круга
-theta = np.linspace(0, 2*np.pi, 100)
-x_outer = center_x + radius * np.cos(theta)
-y_outer = center_y + radius * np.sin(theta)
-
-# Создаем точки для первого внутреннего круга (на 10 мм меньше)
-x_inner1 = center_x + (radius - 10) * np.cos(theta)
-y_inner1 = center_y + (radius - 10) * np.sin(theta)
-
-# Создаем точки для второго внутреннего круга (еще на 10 мм меньше)
-x_inner2 = center_x + (radius - 20) * np.cos(theta)
-y_inner2 = center_y + (radius - 20) * np.sin(theta)
-
-# Создаем точки для третьего внутреннего круга (еще на 20 мм меньше)
-x_inner3 = center_x + (radius - 40) * np.cos(theta)
-y_inner3 = center_y + (radius - 40) * np.sin(theta)
-
-# Создаем точки для четвертого внутреннего круга (еще на 10 мм меньше)
-x_inner4 = center_x + (radius - 60) * np.cos(theta)
-y_inner4 = center_y + (radius - 60) * np.sin(theta)
-
-# Создаем точки для пятого внутреннего круга (еще на 20 мм меньше)
-x_inner5 = center_x + (radius - 80) * np.cos(theta)
-y_inner5 = center_y + (radius - 80) * np.sin(theta)
-
-# Создаем точки для шестого внутреннего круга (еще на 20 мм меньше)
-x_inner6 = center_x + (radius - 100) * np.cos(theta)
-y_inner6 = center_y + (radius - 100) * np.sin(theta)
-
-# Создаем точки для седьмого внутреннего круга (еще на 30 мм меньше)
-x_inner7 = center_x + (radius - 120) * np.cos(theta)
-y_inner7 = center_y + (radius - 120) * np.sin(theta)
-
-# Создаем точки для слоев без армирования
-x_inner1_no = center_x + (radius - 10) * np.cos(theta)
-y_inner1_no = center_y + (radius - 10) * np.sin(theta)
-
-x_inner2_no = center_x + (radius - 30) * np.cos(theta)
-y_inner2_no = center_y + (radius - 30) * np.sin(theta)
-
-x_inner3_no = center_x + (radius - 50) * np.cos(theta)
-y_inner3_no = center_y + (radius - 50) * np.sin(theta)
-
-x_inner4_no = center_x + (radius - 70) * np.cos(theta)
-y_inner4_no = center_y + (radius - 70) * np.sin(theta)
-
-x_inner5_no = center_x + (radius - 100) * np.cos(theta)
-y_inner5_no = center_y + (radius - 100) * np.sin(theta)
-
-x_inner6_no = center_x + (radius - 130) * np.cos(theta)
-y_inner6_no = center_y + (radius - 130) * np.sin(theta)
-
-# Создаем точки армирования (8 точек на расстоянии 50 мм от внешнего диаметра)
-reinforcement_radius = radius - 50
-reinforcement_theta = np.linspace(0, 2*np.pi, 8, endpoint=False)
-reinforcement_x = center_x + reinforcement_radius * np.cos(reinforcement_theta)
-reinforcement_y = center_y + reinforcement_radius * np.sin(reinforcement_theta)
-
-# Добавляем переключатель
-show_reinforcement = st.radio("Отображение армирования:", ["С армированием", "Без армирования"])
-
-fig = go.Figure()
-
-# Внешний круг (заливка)
-fig.add_trace(go.Scatter(
-    x=x_outer, y=y_outer,
-    fill='toself',
-    fillcolor='rgb(0,0,0)',
-    line=dict(width=0),
-    showlegend=False
-))
-
-if show_reinforcement == "С армированием":
-    # Первый внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner1, y=y_inner1,
+# Цвета и подписи контуров внутренних кругов (от внешнего к внутреннему)
+CONTOUR_STYLES = [
+    ('red', 'Первый внутренний контур'),
+    ('green', 'Второй внутренний контур'),
+    ('purple', 'Третий внутренний контур'),
+    ('orange', 'Четвертый внутренний контур'),
+    ('brown', 'Пятый внутренний контур'),
+    ('pink', 'Шестой внутренний контур'),
+    ('gray', 'Седьмой внутренний контур'),
+]
+
+
+def join_with_nan(rows: np.ndarray) -> np.ndarray:
+    """Строки массива в одну линию с разрывами NaN между ними."""
+    gaps = np.full((len(rows), 1), np.nan)
+    return np.hstack([rows, gaps]).ravel()
+
+
+@st.cache_data
+def build_circles(radius: int) -> dict:
+    """Точки окружностей сечения и армирования для заданного радиуса."""
+    # Синус и косинус угла вычисляются один раз для всех окружностей.
+    # 48 точек достаточно для рисунка 500×600; последняя точка совпадает
+    # с первой, поэтому окружности замкнуты
+    theta = np.linspace(0, 2*np.pi, 48)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+
+    # Радиусы окружностей: внешний круг и семь внутренних слоёв с армированием
+    radii = radius - np.array([0, 10, 20, 40, 60, 80, 100, 120])
+    xs = center_x + radii[:, None] * cos_t
+    ys = center_y + radii[:, None] * sin_t
+
+    # Радиусы слоев без армирования
+    radii_no = radius - np.array([10, 30, 50, 70, 100, 130])
+    xs_no = center_x + radii_no[:, None] * cos_t
+    ys_no = center_y + radii_no[:, None] * sin_t
+
+    # Создаем точки армирования (8 точек на расстоянии 50 мм от внешнего диаметра)
+    reinforcement_radius = radius - 50
+    reinforcement_theta = np.linspace(0, 2*np.pi, 8, endpoint=False)
+    reinforcement_x = center_x + reinforcement_radius * np.cos(reinforcement_theta)
+    reinforcement_y = center_y + reinforcement_radius * np.sin(reinforcement_theta)
+
+    # Строки массивов — окружности слоёв от внешней к внутренней
+    return {
+        'outer': (xs[0], ys[0]),
+        'inner': (xs[1:], ys[1:]),
+        'inner_no': (xs_no, ys_no),
+        'reinforcement': (reinforcement_x, reinforcement_y),
+    }
+
+
+@st.cache_data
+def build_figure(show_reinforcement: bool) -> go.Figure:
+    """Рисунок сечения; при повторных запусках берётся из кэша."""
+    circles = build_circles(radius)
+    x_outer, y_outer = circles['outer']
+    x_inner, y_inner = circles['inner']
+    x_inner_no, y_inner_no = circles['inner_no']
+    reinforcement_x, reinforcement_y = circles['reinforcement']
+
+    fig = go.Figure()
+
+    # Внешний круг (заливка)
+    fig.add_trace(go.Scatter(
+        x=x_outer, y=y_outer,
         fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Второй внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner2, y=y_inner2,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
+        fillcolor='rgb(0,0,0)',
         line=dict(width=0),
         showlegend=False
     ))
 
-    # Третий внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner3, y=y_inner3,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
+    # Внутренние слои: семь с армированием, шесть без армирования
+    if show_reinforcement:
+        x_layers, y_layers = x_inner, y_inner
+    else:
+        x_layers, y_layers = x_inner_no, y_inner_no
 
-    # Четвертый внутренний круг (заливка)
+    # Внутренние круги одного цвета — одна заливка, окружности разделены NaN
     fig.add_trace(go.Scatter(
-        x=x_inner4, y=y_inner4,
+        x=join_with_nan(x_layers), y=join_with_nan(y_layers),
         fill='toself',
         fillcolor='rgb(210,209,205)',
         line=dict(width=0),
         showlegend=False
     ))
 
-    # Пятый внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner5, y=y_inner5,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Шестой внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner6, y=y_inner6,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Седьмой внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner7, y=y_inner7,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Контур первого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner1, y=y_inner1,
-        mode='lines',
-        line=dict(width=2, color='red'),
-        name='Первый внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур второго внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner2, y=y_inner2,
-        mode='lines',
-        line=dict(width=2, color='green'),
-        name='Второй внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур третьего внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner3, y=y_inner3,
-        mode='lines',
-        line=dict(width=2, color='purple'),
-        name='Третий внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур четвертого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner4, y=y_inner4,
-        mode='lines',
-        line=dict(width=2, color='orange'),
-        name='Четвертый внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур пятого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner5, y=y_inner5,
-        mode='lines',
-        line=dict(width=2, color='brown'),
-        name='Пятый внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур шестого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner6, y=y_inner6,
-        mode='lines',
-        line=dict(width=2, color='pink'),
-        name='Шестой внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур седьмого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner7, y=y_inner7,
+    # Контуры внутренних кругов (линии и точки — через WebGL, заливки — обычный Scatter)
+    for x_layer, y_layer, (color, name) in zip(x_layers, y_layers, CONTOUR_STYLES):
+        fig.add_trace(go.Scattergl(
+            x=x_layer, y=y_layer,
+            mode='lines',
+            line=dict(width=2, color=color),
+            name=name,
+            showlegend=True
+        ))
+
+    if show_reinforcement:
+        # Точки армирования
+        fig.add_trace(go.Scattergl(
+            x=reinforcement_x, y=reinforcement_y,
+            mode='markers',
+            marker=dict(
+                size=10,  # Размер точки 10 мм
+                color='red',
+                line=dict(width=1, color='black')
+            ),
+            name='Армирование 8Ø10'
+        ))
+
+    # Контур внешнего круга
+    fig.add_trace(go.Scattergl(
+        x=x_outer, y=y_outer,
         mode='lines',
-        line=dict(width=2, color='gray'),
-        name='Седьмой внутренний контур',
+        line=dict(width=2, color='blue'),
+        name='Внешний контур',
         showlegend=True
     ))
 
-    # Точки армирования
-    fig.add_trace(go.Scatter(
-        x=reinforcement_x, y=reinforcement_y,
-        mode='markers',
-        marker=dict(
-            size=10,  # Размер точки 10 мм
-            color='red',
-            line=dict(width=1, color='black')
+    # Настройки осей
+    fig.update_xaxes(range=[-270, 270], tickvals=[-250, -200, -150, -100, -50, 0, 50, 100, 150, 200, 250])
+    fig.update_yaxes(range=[-270, 270], tickvals=[-250, -200, -150, -100, -50, 0, 50, 100, 150, 200, 250])
+
+    fig.update_layout(
+        width=500, height=600,
+        plot_bgcolor='white',
+        showlegend=True,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.35,
+            xanchor="center",
+            x=0.5,
+            font=dict(size=12)
         ),
-        name='Армирование 8Ø10'
-    ))
+        margin=dict(l=40, r=40, t=40, b=120)
+    )
 
-else:  # Без армирования
-    # Первый внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner1_no, y=y_inner1_no,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Второй внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner2_no, y=y_inner2_no,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
+    return fig
 
-    # Третий внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner3_no, y=y_inner3_no,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Четвертый внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner4_no, y=y_inner4_no,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Пятый внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner5_no, y=y_inner5_no,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
 
-    # Шестой внутренний круг (заливка)
-    fig.add_trace(go.Scatter(
-        x=x_inner6_no, y=y_inner6_no,
-        fill='toself',
-        fillcolor='rgb(210,209,205)',
-        line=dict(width=0),
-        showlegend=False
-    ))
-
-    # Контур первого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner1_no, y=y_inner1_no,
-        mode='lines',
-        line=dict(width=2, color='red'),
-        name='Первый внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур второго внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner2_no, y=y_inner2_no,
-        mode='lines',
-        line=dict(width=2, color='green'),
-        name='Второй внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур третьего внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner3_no, y=y_inner3_no,
-        mode='lines',
-        line=dict(width=2, color='purple'),
-        name='Третий внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур четвертого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner4_no, y=y_inner4_no,
-        mode='lines',
-        line=dict(width=2, color='orange'),
-        name='Четвертый внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур пятого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner5_no, y=y_inner5_no,
-        mode='lines',
-        line=dict(width=2, color='brown'),
-        name='Пятый внутренний контур',
-        showlegend=True
-    ))
-
-    # Контур шестого внутреннего круга
-    fig.add_trace(go.Scatter(
-        x=x_inner6_no, y=y_inner6_no,
-        mode='lines',
-        line=dict(width=2, color='pink'),
-        name='Шестой внутренний контур',
-        showlegend=True
-    ))
-
-# Контур внешнего круга
-fig.add_trace(go.Scatter(
-    x=x_outer, y=y_outer,
-    mode='lines',
-    line=dict(width=2, color='blue'),
-    name='Внешний контур',
-    showlegend=True
-))
-
-# Настройки осей
-fig.update_xaxes(range=[-270, 270], tickvals=[-250, -200, -150, -100, -50, 0, 50, 100, 150, 200, 250])
-fig.update_yaxes(range=[-270, 270], tickvals=[-250, -200, -150, -100, -50, 0, 50, 100, 150, 200, 250])
+# Добавляем переключатель
+show_reinforcement = st.radio("Отображение армирования:", ["С армированием", "Без армирования"])
 
-fig.update_layout(
-    width=500, height=600,
-    plot_bgcolor='white',
-    showlegend=True,
-    legend=dict(
-        orientation="h",
-        yanchor="bottom",
-        y=-0.35,
-        xanchor="center",
-        x=0.5,
-        font=dict(size=12)
-    ),
-    margin=dict(l=40, r=40, t=40, b=120)
-)
+fig = build_figure(show_reinforcement == "С армированием")
 
 st.plotly_chart(fig, use_container_width=False)
\ No newline at end of file